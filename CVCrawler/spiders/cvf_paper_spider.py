@@ -3,6 +3,9 @@ This spider crawls CVF paper abstracts to a json file.
 """
 
 import scrapy
+from lxml import etree
+
+_LINKS_XPATH = etree.XPath("//*[@id='content']/dl/dt/a/@href", smart_strings=False)
 
 
 class PaperSpider(scrapy.Spider):
@@ -13,15 +16,18 @@ class PaperSpider(scrapy.Spider):
         self.start_urls = [f"https://openaccess.thecvf.com/{conference}{year}?day=all"]
 
     def parse(self, response):  # noqa
-        paper_links = response.xpath("//*[@id='content']/dl/dt/a/@href").getall()
+        paper_links = _LINKS_XPATH(response.selector.root)
         yield from response.follow_all(paper_links, self.parse_paper)
 
     def parse_paper(self, response):  # noqa
-        def extract_with_xpath(query):
-            return response.xpath(query).get().strip()
+        # query the parsed lxml tree directly instead of re-evaluating through selectors
+        root = response.selector.root
+
+        def extract_with_path(path):
+            return root.find(path).text.strip()
 
         yield {
-            "title": extract_with_xpath("//*[@id='papertitle']/text()"),
-            "authors": extract_with_xpath("//*[@id='authors']/b/i/text()"),
-            "abstract": extract_with_xpath("//*[@id='abstract']/text()"),
+            "title": extract_with_path(".//*[@id='papertitle']"),
+            "authors": extract_with_path(".//*[@id='authors']/b/i"),
+            "abstract": extract_with_path(".//*[@id='abstract']"),
         }
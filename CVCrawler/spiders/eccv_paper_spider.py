@@ -3,6 +3,12 @@ This spider crawls ECCV paper abstracts to a json file.
 """
 
 import scrapy
+from lxml import etree
+
+_LINKS_XPATHS = {
+    "2022": etree.XPath("/html/body/main/div[2]/div[1]/div/dl/dt/a/@href", smart_strings=False),
+    "2020": etree.XPath("/html/body/main/div[2]/div[2]/div/dl/dt/a/@href", smart_strings=False),
+}
 
 
 class PaperSpider(scrapy.Spider):
@@ -15,19 +21,20 @@ class PaperSpider(scrapy.Spider):
 
     def parse(self, response):  # noqa
         paper_links = None
-        if self.year == "2022":
-            paper_links = response.xpath("/html/body/main/div[2]/div[1]/div/dl/dt/a/@href").getall()
-        elif self.year == "2020":
-            paper_links = response.xpath("/html/body/main/div[2]/div[2]/div/dl/dt/a/@href").getall()
+        if self.year in _LINKS_XPATHS:
+            paper_links = _LINKS_XPATHS[self.year](response.selector.root)
 
         yield from response.follow_all(paper_links, self.parse_paper)
 
     def parse_paper(self, response):  # noqa
-        def extract_with_xpath(query):
-            return response.xpath(query).get().strip()
+        # query the parsed lxml tree directly instead of re-evaluating through selectors
+        root = response.selector.root
+
+        def extract_with_path(path):
+            return root.find(path).text.strip()
 
         yield {
-            "title": extract_with_xpath("//*[@id='papertitle']/text()"),
-            "authors": extract_with_xpath("//*[@id='authors']/b/i/text()"),
-            "abstract": extract_with_xpath("//*[@id='abstract']/text()"),
+            "title": extract_with_path(".//*[@id='papertitle']"),
+            "authors": extract_with_path(".//*[@id='authors']/b/i"),
+            "abstract": extract_with_path(".//*[@id='abstract']"),
         }
@@ -1,13 +1,37 @@
 import argparse
+import io
+import mmap
+import multiprocessing
 import os.path
 from pathlib import Path
 from typing import Dict, Tuple, List, Callable
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from itertools import repeat
+from queue import Queue
+from threading import Thread
+import orjson
 import re
 from docx import Document
+from docx.opc import phys_pkg
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from xml.sax.saxutils import escape
 from tqdm import tqdm
 from time import time, strftime, gmtime
+from functools import lru_cache, partial
+
+_RE_NEWLINES = re.compile(r"\n+")
+_RE_RUN_BREAKS = re.compile(r"([\t\r\n])")
+_CTRL_TABLE = dict.fromkeys([*range(0x00, 0x09), 0x0b, *range(0x0e, 0x20), 0x7f])
+
+# Keep-alive connections to OpenReview, backing off on 429 rather than hammering it with parallel offsets.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                                       max_retries=Retry(total=5, backoff_factor=1,
+                                                         status_forcelist=[429, 500, 502, 503, 504])))
 
 
 def time_cost(func: Callable) -> Callable:
@@ -39,32 +63,46 @@ def lazy_export(args: argparse.PARSER) -> None:
     :param args: Arguments from CLI.
     """
 
-    def _export(_args: argparse.PARSER, _years: List[str]) -> None:
-        """Handle different years of each conference.
+    def _prefetch(_queue: Queue) -> None:
+        """Populate json logits of each conference and year, then hand them over to be exported.
 
-        :param _args: Adapted Arguments from CLI.
-        :param _years: Adapted years.
+        :param _queue: Queue of prefetched conferences and years.
         """
 
-        for _year in _years:
-            _args.year = _year
-            parse(_args)
-
-    conferences = ["CVPR", "ICCV", "NeurIPS", "ICLR", "ICML", "ECCV"]
-    for conference in conferences:
-        args.conference = conference
-        if conference == "CVPR":
-            _export(args, ["2023", "2022", "2021"])
-        elif conference == "ICCV":
-            _export(args, ["2023", "2021"])
-        elif conference == "NeurIPS":
-            _export(args, ["2023", "2022", "2021"])
-        elif conference == "ICLR":
-            _export(args, ["2024", "2023", "2022", "2021"])
-        elif conference == "ICML":
-            _export(args, ["2023"])
-        elif conference == "ECCV":
-            _export(args, ["2022", "2020"])
+        try:
+            for _conference, _years in schedule.items():
+                for _year in _years:
+                    _source, _accepted_types = _collate(_conference, _year)
+                    if _source == "openreview":
+                        _urls = get_openreview_url(_conference, _year, _accepted_types)
+                        for _accepted_type, _url in _urls.items():
+                            _json_data_path = f'logits/{_conference}_{_year}_{_accepted_type}_Abstract.json'
+                            if not os.path.exists(_json_data_path):
+                                _json_logits(_json_data_path, _url)
+                    _queue.put((_conference, _year))
+            _queue.put(None)
+        except BaseException as e:  # noqa
+            _queue.put(e)
+
+    schedule = {
+        "CVPR": ["2023", "2022", "2021"],
+        "ICCV": ["2023", "2021"],
+        "NeurIPS": ["2023", "2022", "2021"],
+        "ICLR": ["2024", "2023", "2022", "2021"],
+        "ICML": ["2023"],
+        "ECCV": ["2022", "2020"],
+    }
+
+    # Downloading the next json logits overlaps with exporting the previous docx files.
+    queue = Queue(maxsize=2)
+    producer = Thread(target=_prefetch, args=(queue,), daemon=True)
+    producer.start()
+    while (item := queue.get()) is not None:
+        if isinstance(item, BaseException):
+            raise item
+        args.conference, args.year = item
+        parse(args)
+    producer.join()
 
 
 @time_cost
@@ -90,6 +128,30 @@ def collate(conference: str, year: str, select: bool) -> Tuple[str, List[str]]:
     :param select: Indicates that whether interactively select specific accepted types.
     """
 
+    source, accepted_types = _collate(conference, year)
+
+    if source == "openreview":
+        accepted_types = list(accepted_types)
+        if select:
+            index = input(f"Selecting from {accepted_types}: \n"
+                          f"(select by numbers and separate by spaces, e.g., `0` | `0 1` | ...)\n").strip().split()
+            accepted_types = [accepted_types[int(i)] for i in index]
+        print(f"Outputting abstract of {accepted_types} papers of {conference} {year} ...")
+    else:
+        print(f"Outputting abstract of papers of {conference} {year} ...")
+
+    return source, accepted_types
+
+
+@lru_cache(maxsize=64)
+def _collate(conference: str, year: str) -> Tuple[str, Tuple[str, ...]]:
+    """Collate input conference and all of its accepted types, without interaction.
+
+    :param conference: Exact abbreviation of conference.
+    :param year: Year of conference.
+    :return: Conference source and accepted types.
+    """
+
     openreview = ["NeurIPS", "ICLR", "ICML"]
     cvf = ["CVPR", "ICCV"]
     other = ["ECCV"]
@@ -104,33 +166,27 @@ def collate(conference: str, year: str, select: bool) -> Tuple[str, List[str]]:
             assert year in ["2023", "2022", "2021"], f"unsupported year for {conference} so far"
 
             if year == "2023":
-                accepted_types = ["oral", "spotlight", "poster"]
+                accepted_types = ("oral", "spotlight", "poster")
             elif year == "2022":
-                accepted_types = ["Accept"]
+                accepted_types = ("Accept",)
             elif year == "2021":
-                accepted_types = ["Oral", "Spotlight", "Poster"]
+                accepted_types = ("Oral", "Spotlight", "Poster")
 
         elif conference == "ICLR":
             assert year in ["2024", "2023", "2022", "2021"], f"unsupported year for {conference} so far"
 
             if year == "2024":
-                accepted_types = ["oral", "spotlight", "poster"]
+                accepted_types = ("oral", "spotlight", "poster")
             elif year == "2023":
-                accepted_types = ["notable_top_5%", "notable_top_25%", "poster"]
+                accepted_types = ("notable_top_5%", "notable_top_25%", "poster")
             elif year in ["2022", "2021"]:
-                accepted_types = ["Oral", "Spotlight", "Poster"]
+                accepted_types = ("Oral", "Spotlight", "Poster")
 
         elif conference == "ICML":
             assert year in ["2023"], f"unsupported year for {conference} so far"
 
             if year == "2023":
-                accepted_types = ["Poster", "OralPoster"]
-
-        if select:
-            index = input(f"Selecting from {accepted_types}: \n"
-                          f"(select by numbers and separate by spaces, e.g., `0` | `0 1` | ...)\n").strip().split()
-            accepted_types = [accepted_types[int(i)] for i in index]
-        print(f"Outputting abstract of {accepted_types} papers of {conference} {year} ...")
+                accepted_types = ("Poster", "OralPoster")
 
     elif conference in cvf:
         source = "cvf"
@@ -140,8 +196,6 @@ def collate(conference: str, year: str, select: bool) -> Tuple[str, List[str]]:
             assert year in ["2023", "2021"], f"unsupported year for {conference} so far, " \
                                              f"also note that {conference} is biennial"
 
-        print(f"Outputting abstract of papers of {conference} {year} ...")
-
     elif conference in other:
         source = None
         # The root web containing ECCV papers surprisingly has the same style as cvf.
@@ -150,66 +204,160 @@ def collate(conference: str, year: str, select: bool) -> Tuple[str, List[str]]:
             assert year in ["2022", "2020"], f"unsupported year for {conference} so far, " \
                                              f"also note that {conference} is biennial"
 
-        print(f"Outputting abstract of papers of {conference} {year} ...")
-
     return source, accepted_types
 
 
-def extract_info(conference: str, paper: dict) -> Dict[str, str]:
-    """Extract expected information from requested json data.
+def _locate_info(paper_info: dict | list) -> str | list:
+    """Locate accurate information position of different conferences.
+
+    :param paper_info: Candidate expected information of each paper.
+    :return: Accurate expected information of each paper.
+    """
+
+    return paper_info['value'] if isinstance(paper_info, dict) else paper_info
+
+
+def _restrain_bytes(content: str) -> str:
+    """Filter out strange bytes.
+
+    :param content: Content to be restrained.
+    :return: Restrained content.
+    """
+
+    return _RE_NEWLINES.sub(" ", content).translate(_CTRL_TABLE)
+
+
+def _make_extractor(conference: str) -> Callable[[dict], Dict[str, str]]:
+    """Make an extractor of expected information, resolving conference-specific keys once.
 
     :param conference: Exact abbreviation of conference.
-    :param paper: Raw information of each paper in json data.
-    :return: Extracted information of each paper.
+    :return: Extractor of each paper.
     """
 
-    def _locate_info(_paper_info: dict | list) -> str | list:
-        """Locate accurate information position of different conferences.
+    # ICLR papers use either key across years, ICML papers have no TLDR.
+    tldr_keys = {"NeurIPS": ("TLDR",), "ICLR": ("TL;DR", "TLDR")}.get(conference, ())
+
+    def _extract(paper: dict) -> Dict[str, str]:
+        """Extract expected information from requested json data.
 
-        :param _paper_info: Candidate expected information of each paper.
-        :return: Accurate expected information of each paper.
+        :param paper: Raw information of each paper in json data.
+        :return: Extracted information of each paper.
         """
 
-        return _paper_info['value'] if isinstance(_paper_info, dict) else _paper_info
+        content = paper['content']
+        paper_info = dict()
+        paper_info['title'] = _restrain_bytes(_locate_info(content['title']))
+        paper_info['authors'] = _restrain_bytes(", ".join(_locate_info(content['authors'])))
 
-    def _restrain_bytes(content: str) -> str:
-        """Filter out strange bytes.
+        keywords = content.get('keywords')
+        paper_info['keywords'] = _restrain_bytes(", ".join(_locate_info(keywords))) if keywords is not None else None
 
-        :param content: Content to be restrained.
-        :return: Restrained content.
-        """
+        paper_info['abstract'] = _restrain_bytes(_locate_info(content['abstract']))
 
-        content = re.sub(r"\n+", " ", content)
-        content = re.sub(u"[\\x00-\\x08\\x0b\\x0e-\\x1f\\x7f]", "", content)
-        return content
+        tldr = next((content[key] for key in tldr_keys if key in content), None)
+        paper_info['tldr'] = _restrain_bytes(_locate_info(tldr)) if tldr is not None else None
 
-    paper_info = dict()
-    paper_info['title'] = _restrain_bytes(_locate_info(paper['content']['title']))
-    paper_info['authors'] = _restrain_bytes(", ".join(_locate_info(paper['content']['authors'])))
+        paper_info['full_text'] = _restrain_bytes('https://openreview.net' + _locate_info(content['pdf']))
 
-    try:
-        paper_info['keywords'] = _restrain_bytes(", ".join(_locate_info(paper['content']['keywords'])))
-    except KeyError:
-        paper_info['keywords'] = None
+        return paper_info
 
-    paper_info['abstract'] = _restrain_bytes(_locate_info(paper['content']['abstract']))
+    return _extract
+
+
+def load_json(json_path: str) -> dict | list:
+    """Load json file by memory-mapping it, which avoids copying the whole file into a read buffer.
+
+    :param json_path: Path of json file.
+    :return: Json data.
+    """
+
+    with open(json_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def dump_json(json_data: dict | list, json_path: str) -> None:
+    """Dump json data atomically, so that an interrupted dump never leaves a truncated json file.
+
+    :param json_data: Json data.
+    :param json_path: Path of json file.
+    """
+
+    tmp_path = json_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(json_data))
+    os.replace(tmp_path, json_path)
+
+
+def _request_json(url: str) -> dict:
+    """Request json data, streaming the response body with `ijson` if available.
+
+    :param url: OpenReview url.
+    :return: Requested json data.
+    """
 
     try:
-        if conference == "NeurIPS":
-            paper_info['tldr'] = _restrain_bytes(_locate_info(paper['content']['TLDR']))
-        elif conference == "ICLR":
-            if 'TL;DR' in paper['content'].keys():
-                paper_info['tldr'] = _restrain_bytes(_locate_info(paper['content']['TL;DR']))
-            else:
-                paper_info['tldr'] = _restrain_bytes(_locate_info(paper['content']['TLDR']))
-        elif conference == "ICML":
-            paper_info['tldr'] = None
-    except KeyError:
-        paper_info['tldr'] = None
+        import ijson
+    except ImportError:
+        r = _SESSION.get(url)
+        r.raise_for_status()
+        return r.json()
+
+    with _SESSION.get(url, stream=True) as r:
+        r.raise_for_status()
+        r.raw.decode_content = True
+        return dict(ijson.kvitems(r.raw, '', use_float=True))
+
+
+def _json_logits(json_data_path: str, url: str) -> dict:
+    """Load json logits from local cache, or request and cache them if not available.
+
+    :param json_data_path: Path of json logits.
+    :param url: OpenReview url.
+    :return: Json data of all papers.
+    """
+
+    if os.path.exists(json_data_path):
+        json_data = load_json(json_data_path)
+    else:
+        json_data = _request_json(url)
+        paper_counts = int(json_data['count'])
+        default_offset = 1000
+        if paper_counts > default_offset:
+            offset_urls = [url + f"&offset={offset}" for offset in range(default_offset, paper_counts, default_offset)]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                # `map` preserves the order of offsets
+                for notes in executor.map(lambda u: _request_json(u)['notes'], offset_urls):
+                    json_data['notes'].extend(notes)
+
+        dump_json(json_data, json_data_path)
+
+    return json_data
+
+
+def _extracted_logits(conference: str, year: str, accepted_type: str, url: str) -> List[Dict[str, str]]:
+    """Load extracted information from local cache, or extract it from json logits and cache it if not up to date.
+
+    :param conference: Exact abbreviation of conference.
+    :param year: Year of conference.
+    :param accepted_type: Accepted type of conference.
+    :param url: OpenReview url of the accepted type.
+    :return: Extracted information of all papers.
+    """
 
-    paper_info['full_text'] = _restrain_bytes('https://openreview.net' + _locate_info(paper['content']['pdf']))
+    json_data_path = f'logits/{conference}_{year}_{accepted_type}_Abstract.json'
+    extracted_path = f'logits/{conference}_{year}_{accepted_type}_Extracted.json'
+    # The cache is stale once json logits are removed or re-downloaded.
+    if os.path.exists(extracted_path) and os.path.exists(json_data_path) \
+            and os.path.getmtime(extracted_path) >= os.path.getmtime(json_data_path):
+        return load_json(extracted_path)
 
-    return paper_info
+    json_data = _json_logits(json_data_path, url)
+    extract = _make_extractor(conference)
+    infos = [extract(paper) for paper in json_data['notes']]
+    dump_json(infos, extracted_path)
+
+    return infos
 
 
 def parse_openreview(conference: str, year: str, accepted_types: List[str], toc: bool, pdf: bool, wps: bool) -> None:
@@ -223,58 +371,66 @@ def parse_openreview(conference: str, year: str, accepted_types: List[str], toc:
     :param wps: Use WPS to convert pdf.
     """
 
-    def _json_logits(_json_data_path: str, _url: str) -> dict:
-        if os.path.exists(_json_data_path):
-            with open(_json_data_path, 'r') as _f:
-                _json_data = json.load(_f)
-        else:
-            _json_data = requests.get(_url).json()
-            _paper_counts = int(_json_data['count'])
-            _default_offset = 1000
-            if _paper_counts > _default_offset:
-                for _offset in range(_default_offset, _paper_counts, _default_offset):
-                    _offset_url = _url + f"&offset={_offset}"
-                    _json_data['notes'].extend(requests.get(_offset_url).json()['notes'])
-
-            with open(_json_data_path, 'w') as _f:
-                _f.write(json.dumps(_json_data))
-
-        return _json_data
-
-    urls = get_openreview_url(conference, year, accepted_types)
-    for accepted_type, url in urls.items():
-        document = Document()
-        if toc:
-            generate_toc(document)
-            document.add_page_break()
-
-        json_data = _json_logits(f'logits/{conference}_{year}_{accepted_type}_Abstract.json', url)
-
-        for paper in tqdm(json_data['notes']):
-            info = extract_info(conference, paper)
+    suffix = "_TOC" if toc else ""
+    dst_path = f'results/docx{suffix.lower()}'
+    Path(dst_path).mkdir(parents=True, exist_ok=True)
 
-            document.add_heading(info['title'], level=2)
-            bold_prefix(document, "Authors: ", info['authors'])
-            bold_prefix(document, "Keywords: ", info['keywords'])
-            bold_prefix(document, "TLDR: ", info['tldr'])
-            bold_prefix(document, "Abstract: ", info['abstract'])
-            bold_prefix(document, "Full Text: ", info['full_text'])
+    urls = get_openreview_url(conference, year, tuple(accepted_types))
+    if not urls:
+        return None
 
-        if not os.path.exists('results'):
-            os.makedirs('results')
-        suffix = "_TOC" if toc else ""
-        dst_path = f'results/docx{suffix.lower()}'
-        if not os.path.exists(dst_path):
-            os.makedirs(dst_path)
+    # Each accepted type is rendered into an independent docx file, in its own process.
+    # Workers are spawned rather than forked, since the `lazy_export` producer thread may hold locks of `_SESSION`.
+    with ProcessPoolExecutor(max_workers=len(urls), mp_context=multiprocessing.get_context("spawn")) as executor:
+        save_paths = list(executor.map(_render_one, repeat(conference), repeat(year), urls.keys(), urls.values(),
+                                       repeat(toc)))
 
-        save_path = f"{dst_path}/{int(json_data['count'])}_{accepted_type}_{conference}_{year}_Abstract{suffix}.docx"
-        document.save(save_path)
+    # Word/WPS is driven through COM one document at a time.
+    for save_path in save_paths:
         if toc:
             update_field(os.path.abspath(save_path), wps)
         if pdf:
             generate_pdf(os.path.abspath(save_path), wps)
 
 
+def _render_one(conference: str, year: str, accepted_type: str, url: str, toc: bool) -> str:
+    """Render OpenReview style paper abstracts of one accepted type to a docx file.
+
+    :param conference: Exact abbreviation of conference.
+    :param year: Year of conference.
+    :param accepted_type: Accepted type of conference.
+    :param url: OpenReview url of the accepted type.
+    :param toc: Indicates that whether table of contents is required.
+    :return: Path of the saved docx file.
+    """
+
+    document = Document()
+    if toc:
+        generate_toc(document)
+        document.add_page_break()
+
+    infos = _extracted_logits(conference, year, accepted_type, url)
+
+    # resolve the heading style once instead of per paper
+    heading_style_id = document.styles["Heading 2"].style_id
+    paragraphs = []
+    for info in tqdm(infos, desc=accepted_type):
+        paragraphs.append(heading(info['title'], heading_style_id))
+        paragraphs.append(bold_prefix("Authors: ", info['authors']))
+        paragraphs.append(bold_prefix("Keywords: ", info['keywords']))
+        paragraphs.append(bold_prefix("TLDR: ", info['tldr']))
+        paragraphs.append(bold_prefix("Abstract: ", info['abstract']))
+        paragraphs.append(bold_prefix("Full Text: ", info['full_text']))
+    append_paragraphs(document, paragraphs)
+
+    suffix = "_TOC" if toc else ""
+    dst_path = f'results/docx{suffix.lower()}'
+    save_path = f"{dst_path}/{len(infos)}_{accepted_type}_{conference}_{year}_Abstract{suffix}.docx"
+    save_docx(document, save_path)
+
+    return save_path
+
+
 def parse_cvf(conference: str, year: str, toc: bool, pdf: bool, wps: bool) -> None:
     """Parse CVF style paper abstracts from the requested json data to a docx file.
 
@@ -285,13 +441,11 @@ def parse_cvf(conference: str, year: str, toc: bool, pdf: bool, wps: bool) -> No
     :param wps: Use WPS to convert pdf.
     """
 
-    with open(f'logits/{conference}_{year}_Abstract.json', 'rb') as f:
-        json_data = json.load(f)
+    json_data = load_json(f'logits/{conference}_{year}_Abstract.json')
 
     suffix = "_TOC" if toc else ""
     save_docx_dir = f'results/docx{suffix.lower()}'
-    if not os.path.exists(save_docx_dir):
-        os.makedirs(save_docx_dir)
+    Path(save_docx_dir).mkdir(parents=True, exist_ok=True)
 
     save_docx_path = f"{save_docx_dir}/{len(json_data)}_{conference}_{year}_Abstract{suffix}.docx"
     write_docx = True
@@ -305,9 +459,12 @@ def parse_cvf(conference: str, year: str, toc: bool, pdf: bool, wps: bool) -> No
             generate_toc(document)
             document.add_page_break()
 
+        # resolve the heading style once instead of per paper
+        heading_style_id = document.styles["Heading 2"].style_id
+        paragraphs = []
         for paper in tqdm(json_data):
-            document.add_heading(paper['title'], level=2)
-            bold_prefix(document, "Authors: ", paper['authors'])
+            paragraphs.append(heading(paper['title'], heading_style_id))
+            paragraphs.append(bold_prefix("Authors: ", paper['authors']))
 
             # The root web containing ECCV papers surprisingly has the same style as cvf,
             # so seamlessly borrows this function.
@@ -315,9 +472,10 @@ def parse_cvf(conference: str, year: str, toc: bool, pdf: bool, wps: bool) -> No
             if conference == "ECCV":
                 paper['abstract'] = paper['abstract'].strip(r'\"')
 
-            bold_prefix(document, "Abstract: ", paper['abstract'])
+            paragraphs.append(bold_prefix("Abstract: ", paper['abstract']))
+        append_paragraphs(document, paragraphs)
 
-        document.save(save_docx_path)
+        save_docx(document, save_docx_path)
         if toc:
             update_field(os.path.abspath(save_docx_path), wps)
 
@@ -325,21 +483,88 @@ def parse_cvf(conference: str, year: str, toc: bool, pdf: bool, wps: bool) -> No
         generate_pdf(os.path.abspath(save_docx_path), wps)
 
 
-def bold_prefix(document: Document, prefix: str, content: str) -> None:
-    """Emphasize the prefix with the bold style.
+def save_docx(document: Document, save_path: str, compresslevel: int = 1) -> None:
+    """Save the document atomically, so that an interrupted save never leaves a corrupted docx file.
 
     :param document: Document object.
+    :param save_path: Path of docx file.
+    :param compresslevel: Deflate level of the docx zip, lower is faster but slightly larger.
+    """
+
+    # python-docx always deflates at the default level, which dominates saving large documents.
+    zip_file = phys_pkg.ZipFile
+    phys_pkg.ZipFile = partial(zip_file, compresslevel=compresslevel)
+    buffer = io.BytesIO()
+    try:
+        document.save(buffer)
+    finally:
+        phys_pkg.ZipFile = zip_file
+    tmp_path = save_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(buffer.getbuffer())
+    os.replace(tmp_path, save_path)
+
+
+def run_content(text: str) -> str:
+    """Build the xml of run content, translating tabs and line breaks the same way as `Paragraph.add_run`.
+
+    :param text: Text of the run.
+    :return: Run content xml.
+    """
+
+    content = []
+    for piece in _RE_RUN_BREAKS.split(text):
+        if piece == "\t":
+            content.append("<w:tab/>")
+        elif piece in ("\r", "\n"):
+            content.append("<w:br/>")
+        elif piece:
+            space = ' xml:space="preserve"' if len(piece.strip()) < len(piece) else ''
+            content.append(f'<w:t{space}>{escape(piece)}</w:t>')
+    return "".join(content)
+
+
+def heading(title: str, style_id: str) -> str:
+    """Build the xml of a heading paragraph.
+
+    :param title: Heading text.
+    :param style_id: Style id of the heading, e.g., resolved from `Heading 2`.
+    :return: Paragraph xml.
+    """
+
+    return f'<w:p><w:pPr><w:pStyle w:val="{style_id}"/></w:pPr><w:r>{run_content(title)}</w:r></w:p>'
+
+
+def bold_prefix(prefix: str, content: str) -> str:
+    """Emphasize the prefix with the bold style.
+
     :param prefix: Prefix to be bold.
     :param content: Main content.
+    :return: Paragraph xml, or an empty string if there is no content.
+    """
+
+    if content is None:
+        return ""
+
+    return f'<w:p><w:r><w:rPr><w:b/></w:rPr>{run_content(prefix)}</w:r><w:r>{run_content(content)}</w:r></w:p>'
+
+
+def append_paragraphs(document: Document, paragraphs: List[str]) -> None:
+    """Append paragraph xml to the document body with a single parse.
+
+    :param document: Document object.
+    :param paragraphs: Paragraph xml built by `heading` and `bold_prefix`.
     """
 
-    if content is not None:
-        p = document.add_paragraph()
-        p.add_run(prefix).bold = True
-        p.add_run(content)
+    elements = parse_xml(f"<w:body {nsdecls('w')}>{''.join(paragraphs)}</w:body>")
+    body = document.element.body
+    # paragraphs must precede the trailing section properties
+    index = body.index(body.sectPr) if body.sectPr is not None else len(body)
+    body[index:index] = list(elements)
 
 
-def get_openreview_url(conference: str, year: str, accepted_types: List[str]) -> Dict[str, str]:
+@lru_cache(maxsize=64)
+def get_openreview_url(conference: str, year: str, accepted_types: Tuple[str, ...]) -> Dict[str, str]:
     """Get OpenReview url given the accepted type.
 
     :param conference: Exact abbreviation of conference.
@@ -445,8 +670,7 @@ def generate_pdf(docx_path: str, wps: bool) -> None:
 
     wdFormatPDF = 17
     pdf_path = docx_path.replace("docx", "pdf")
-    if not os.path.exists(Path(pdf_path).parent):
-        os.makedirs(Path(pdf_path).parent)
+    Path(pdf_path).parent.mkdir(parents=True, exist_ok=True)
     open(pdf_path, "w").close()
 
     paper_counts = os.path.basename(docx_path).split("_")[0]